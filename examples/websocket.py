@@ -1,6 +1,5 @@
 import asyncio
 
-import aiohttp
 import logging
 
 from pyevonic.evonic import Evonic
@@ -9,9 +8,7 @@ logging.basicConfig(level=logging.DEBUG)
 
 
 async def main():
-    session = aiohttp.ClientSession()
-
-    async with Evonic("192.168.1.190", session=session) as ev:
+    async with Evonic("192.168.1.190") as ev:
         await ev.connect()
         if ev.connected:
             print("Connected!")
@@ -26,4 +23,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
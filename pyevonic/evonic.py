@@ -2,13 +2,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import socket
 import logging
-from dataclasses import dataclass
 
 import aiohttp
-import async_timeout
+import orjson
 from yarl import URL
 
 from .models import Device
@@ -24,17 +22,104 @@ from .exceptions import (
 LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+def _json_dumps(obj) -> str:
+    """Serialize an object to a JSON string using orjson.
+
+    aiohttp expects a ``str`` from its serializers, while orjson returns ``bytes``.
+    """
+    return orjson.dumps(obj).decode("utf8")
+
+
+_TEXT = aiohttp.WSMsgType.TEXT
+_ERROR = aiohttp.WSMsgType.ERROR
+_PING = aiohttp.WSMsgType.PING
+_PONG = aiohttp.WSMsgType.PONG
+_CLOSED_MESSAGE_TYPES = frozenset({
+    aiohttp.WSMsgType.CLOSE,
+    aiohttp.WSMsgType.CLOSED,
+    aiohttp.WSMsgType.CLOSING,
+})
+
+_POWER_CMDS = frozenset({"on", "off", "toggle"})
+
+# Seconds between keepalive pings sent to the fire's WebSocket. aiohttp closes the
+# connection if no PONG is received in response
+_PING_INTERVAL = 30
+
+# Effects available for each fire type, information pulled from /options.htm
+_DEFAULT_EFFECTS = ("Vero", "Ignite", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green",
+                    "Blue", "Violet", "White")
+_EOS_EFFECTS = ("Eos", *_DEFAULT_EFFECTS)
+_ILUSION_EFFECTS = ("Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire")
+_EVOFLAME_EFFECTS = ("Evoflame", "Party")
+_SL_EFFECTS = ("Ignite", "Fiesta")
+_VIDEO_EFFECTS = ("Low", "Medium", "High")
+
+_EOS_CONFIGS = frozenset({"1800", "ds1030", "hal800", "hal1030", "hal1500", "hal2400", "halev4", "halev8", "irpanel",
+                          "v630", "v730", "v1030"})
+_ILUSION_CONFIGS = frozenset({"ilusion2", "alisio1150", "alisio1550", "alisio1850", "alisio850"})
+_EVOFLAME_CONFIGS = frozenset({"alente", "e1030", "e1250", "e1500", "e1800", "e2400", "e500", "e800"})
+_SL_CONFIGS = frozenset({"sl600", "sl700", "sl1000", "sl1250", "sl1500"})
+_VIDEO_CONFIGS = frozenset({"video"})
+
+_EFFECTS_BY_CONFIG: dict[str, tuple[str, ...]] = {
+    **dict.fromkeys(_EOS_CONFIGS, _EOS_EFFECTS),
+    **dict.fromkeys(_ILUSION_CONFIGS, _ILUSION_EFFECTS),
+    **dict.fromkeys(_EVOFLAME_CONFIGS, _EVOFLAME_EFFECTS),
+    **dict.fromkeys(_SL_CONFIGS, _SL_EFFECTS),
+    **dict.fromkeys(_VIDEO_CONFIGS, _VIDEO_EFFECTS),
+}
+
+
 class Evonic:
     """Main class for handling connections with Evonic Fires."""
 
-    host: str
-    request_timeout: float = 8.0
-    session: aiohttp.client.ClientSession | None = None
+    __slots__ = (
+        "_host",
+        "_request_timeout",
+        "session",
+        "_client",
+        "_close_session",
+        "_device",
+        "_timeout",
+        "_http_base",
+        "_ws_url",
+    )
+
+    def __init__(
+            self,
+            host: str,
+            request_timeout: float = 8.0,
+            session: aiohttp.client.ClientSession | None = None,
+    ):
+        self.host = host
+        self.request_timeout = request_timeout
+        self.session = session
+
+        self._client: aiohttp.ClientWebSocketResponse | None = None
+        self._close_session = False
+        self._device: Device | None = None
+
+    @property
+    def host(self) -> str:
+        """Return the host of the Evonic Fire."""
+        return self._host
 
-    _client: aiohttp.ClientWebSocketResponse | None = None
-    _close_session: bool = False
-    _device: Device | None = None
+    @host.setter
+    def host(self, value: str):
+        self._host = value
+        self._http_base = URL.build(scheme="http", host=value)
+        self._ws_url = URL.build(scheme="ws", host=value, port=81)
+
+    @property
+    def request_timeout(self) -> float:
+        """Return the timeout in seconds for HTTP requests to the Evonic Fire."""
+        return self._request_timeout
+
+    @request_timeout.setter
+    def request_timeout(self, value: float):
+        self._request_timeout = value
+        self._timeout = aiohttp.ClientTimeout(total=value)
 
     @property
     def connected(self) -> bool:
@@ -60,11 +145,8 @@ class Evonic:
             LOGGER.debug("Already Connected")
             return
 
-        if self.session is None:
-            LOGGER.debug("No session exists, using ClientSession")
-            self.session = aiohttp.ClientSession()
-
-        url = URL.build(scheme="ws", host=self.host, port=81)
+        session = self.__get_session()
+        url = self._ws_url
 
         try:
             await self.request("/modules.json", "GET", None)
@@ -72,9 +154,12 @@ class Evonic:
             await self.request("/config.admin.json", "GET", None)
             await self.__available_effects()
             LOGGER.debug(f"Connecting Websocket to: {url}")
-            self._client = await self.session.ws_connect(url=url)
+            # Keepalive pings are sent by aiohttp's heartbeat rather than handled on the read path
+            self._client = await session.ws_connect(
+                url=url, autoping=False, heartbeat=_PING_INTERVAL, compress=0
+            )
             await self.__send_cmd("get config.setup")
-            return self._client, self.session
+            return self._client, session
 
         except (
                 aiohttp.WSServerHandshakeError,
@@ -86,14 +171,16 @@ class Evonic:
                 f" on WebSocket at {self.host}"
             ) from exception
 
-    async def listen(self, callback):
+    async def listen(self, callback, coalesce_interval=0.0):
         """ Listen for events on the Evonic Fire WebSocket
 
         Args:
             callback: Method to call when an update is received from the Evonic Fire
+            coalesce_interval: Seconds to batch rapid updates for. When greater than 0,
+                callback is called at most once per interval with the latest state
 
         Raises:
-            EvonicError: Not connected to the WebSocket
+            EvonicError: Not connected to the WebSocket, or no device has been initialised
             EvonicConnectionError: An connection error occurred while connected
                 to the Evonic Fire
             EvonicConnectionClosed: The WebSocket connection to the Evonic Fire has been closed.
@@ -102,31 +189,87 @@ class Evonic:
         if not self._client:
             raise EvonicError("Not connected to a Evonic Fire WebSocket")
 
-        while not self._client.closed:
-            message = await self._client.receive()
-
-            if message.type == aiohttp.WSMsgType.ERROR:
-                raise EvonicConnectionError(self._client.exception())
-
-            if message.type == aiohttp.WSMsgType.TEXT:
-                message_data = message.json()
-
-                if self._device is None:
-                    LOGGER.debug("No Device exists, creating new instance")
-                    self._device = Device(message_data)
+        # connect() seeds the device from /modules.json, so frames only ever update it
+        if self._device is None:
+            raise EvonicError("No device initialised, call connect() first")
 
-                device = self._device.update_from_dict(message_data)
-                LOGGER.debug(message_data)
-                callback(device)
+        device = self._device
+        client = self._client
+        receive = client.receive
+        loop = asyncio.get_running_loop()
+        receive_task = None
+        # Time at which a batched update is due to be passed to callback
+        deadline = None
 
-            if message.type in (
-                    aiohttp.WSMsgType.CLOSE,
-                    aiohttp.WSMsgType.CLOSED,
-                    aiohttp.WSMsgType.CLOSING,
-            ):
-                raise EvonicConnectionClosed(
-                    f"Connection to the Evonic WebSocket on {self.host} has been closed"
-                )
+        try:
+            while not client.closed:
+                if coalesce_interval > 0:
+                    # Keep the receive running across waits, so a batched callback can be
+                    # delivered from here without losing the in-flight read
+                    if receive_task is None:
+                        receive_task = loop.create_task(receive())
+
+                    timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                    done, _ = await asyncio.wait((receive_task,), timeout=timeout)
+                    if not done:
+                        deadline = None
+                        callback(device)
+                        continue
+
+                    message = receive_task.result()
+                    receive_task = None
+                else:
+                    message = await receive()
+
+                message_type = message.type
+
+                if message_type is _TEXT:
+                    message_data = orjson.loads(message.data)
+                    device.update_from_dict(message_data)
+                    LOGGER.debug(message_data)
+
+                    # Device is updated in place, so a delayed callback still sees the latest state
+                    if coalesce_interval > 0:
+                        if deadline is None:
+                            deadline = loop.time() + coalesce_interval
+                    else:
+                        callback(device)
+
+                elif message_type is _PING:
+                    try:
+                        await client.pong(message.data)
+                    except (aiohttp.ClientError, ConnectionError) as exception:
+                        raise EvonicConnectionClosed(
+                            f"Connection to the Evonic WebSocket on {self.host} has been closed"
+                        ) from exception
+
+                elif message_type is _PONG:
+                    pass
+
+                elif message_type is _ERROR:
+                    raise EvonicConnectionError(client.exception())
+
+                elif message_type in _CLOSED_MESSAGE_TYPES:
+                    raise EvonicConnectionClosed(
+                        f"Connection to the Evonic WebSocket on {self.host} has been closed"
+                    )
+
+        except EvonicConnectionError:
+            # Flush any batched update so the latest state is not dropped, without
+            # letting a failing callback mask the connection error
+            if deadline is not None:
+                try:
+                    callback(device)
+                except Exception:
+                    LOGGER.exception("Error in callback while flushing batched update")
+            raise
+
+        finally:
+            if receive_task is not None:
+                receive_task.cancel()
+
+        if deadline is not None:
+            callback(device)
 
     async def disconnect(self):
         """Disconnect from the WebSocket of an Evonic Fire."""
@@ -152,35 +295,29 @@ class Evonic:
             EvonicConnectionError:  A error occurred while communicating with the Evonic Fire
         """
 
-        if host is None:
-            host = self.host
-
-        if scheme is None:
-            scheme = "http"
+        if host is None and scheme is None:
+            url = self._http_base.with_path(uri)
+        else:
+            url = URL.build(scheme=scheme or "http", host=host or self.host, path=uri)
 
-        url = URL.build(scheme=scheme, host=host, path=uri)
-
-        if self.session is None:
-            LOGGER.debug("No session exists, using ClientSession")
-            self.session = aiohttp.ClientSession()
-            self._close_session = True
+        session = self.__get_session()
 
         try:
-            async with async_timeout.timeout(self.request_timeout):
-                response = await self.session.request(method, url, json=data)
-                LOGGER.debug(f"Request Response from {url}:")
+            response = await session.request(method, url, json=data, timeout=self._timeout)
+            LOGGER.debug(f"Request Response from {url}:")
 
             content_type = response.headers.get("Content-Type", "")
+            contents = await response.read()
+
             if (response.status // 100) in [4, 5]:
-                contents = await response.read()
                 response.close()
 
                 if content_type == "application/json":
-                    raise EvonicError(json.loads(contents.decode("utf8")))
-                raise EvonicError(response.status, {"message": contents.decode("utf8")})
+                    raise EvonicError(orjson.loads(contents))
+                raise EvonicError(response.status, {"message": contents.decode("utf8", errors="replace")})
 
             if "application/json" in content_type:
-                response_data = await response.json()
+                response_data = orjson.loads(contents)
 
                 if method == "GET" and uri == "/modules.json":
                     if self._device is None:
@@ -190,8 +327,8 @@ class Evonic:
                 elif method == "GET" and (uri == "/config.options.json" or uri == "/config.admin.json"):
                     self._device.update_from_dict(data=response_data)
 
-                else:
-                    response_data = await response.json()
+            else:
+                response_data = contents.decode("utf8", errors="replace")
 
         except asyncio.TimeoutError as exception:
             raise EvonicConnectionTimeoutError(
@@ -212,7 +349,7 @@ class Evonic:
             EvonicError:  Command is not valid
         """
 
-        if cmd not in ["on", "off", "toggle"]:
+        if cmd not in _POWER_CMDS:
             raise EvonicError("Command not valid. Must be one of 'on', 'off' or 'toggle'")
 
         if cmd == "off":
@@ -266,11 +403,11 @@ class Evonic:
         if rgb_id not in self._device.info.modules:
             raise EvonicUnsupportedFeature(f"{rgb_id} is not supported on this device")
 
-        if not isinstance(brightness, int):
+        if type(brightness) is not int:
             raise EvonicError("speed must be an Integer")
 
         # Must be 0 - 255
-        if brightness not in range(-1, 256):
+        if not 0 <= brightness <= 255:
             raise EvonicError(f"{brightness} is not a valid value. Must be between 0 - 255")
 
         return await self.__send_cmd(f"rgb set {rgb_id[-1]} - - {brightness} -")
@@ -290,11 +427,11 @@ class Evonic:
         if rgb_id not in self._device.info.modules:
             raise EvonicUnsupportedFeature(f"{rgb_id} is not a support RGB ID on this device")
 
-        if not isinstance(speed, int):
+        if type(speed) is not int:
             raise EvonicError("speed must be an Integer")
 
         # Must be 0 - 255
-        if speed not in range(-1, 256):
+        if not 0 <= speed <= 255:
             raise EvonicError(f"{speed} is not a valid value. Must be between 0 - 255")
 
         return await self.__send_cmd(f"rgb set {rgb_id[-1]} - {speed} - -")
@@ -309,19 +446,19 @@ class Evonic:
         if "temperature" not in self._device.info.modules:
             raise EvonicUnsupportedFeature("Temperature Control is not supported on this device")
 
-        if not isinstance(temp, int):
+        if type(temp) is not int:
             raise EvonicError("temp must be an Integer")
 
         if self._device.climate.fahrenheit:
             LOGGER.debug("Temperature is set to Fahrenheit")
             # Must be 50 - 90
-            if temp not in range(49, 91):
+            if not 50 <= temp <= 90:
                 raise EvonicError(f"{temp} is not a valid value. Must be between 50 - 90")
 
         else:
             LOGGER.debug("Temperature is set to Celsius")
             # Must be 11 - 32
-            if temp not in range(10, 33):
+            if not 11 <= temp <= 32:
                 raise EvonicError(f"{temp} is not a valid value. Must be between 11 - 32")
 
         return await self.__send_cmd(f"templevel {temp}")
@@ -336,7 +473,7 @@ class Evonic:
             EvonicError:  Command is not valid
         """
 
-        if cmd not in ["on", "off", "toggle"]:
+        if cmd not in _POWER_CMDS:
             raise EvonicError("Command not valid. Must be one of 'on', 'off' or 'toggle'")
 
         if cmd == "off":
@@ -362,6 +499,21 @@ class Evonic:
                 raise EvonicConnectionError("Unable to connect to device") from err
         return self._device
 
+    def __get_session(self):
+        """ Returns the session shared by the WebSocket and HTTP requests,
+        creating one on first use if none was passed in.
+        """
+
+        if self.session is None:
+            LOGGER.debug("No session exists, using ClientSession")
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300),
+                json_serialize=_json_dumps,
+            )
+            self._close_session = True
+
+        return self.session
+
     async def __send_voice(self, cmd):
         """ Sends a command via Websocket Client.
 
@@ -373,7 +525,7 @@ class Evonic:
             raise Exception("Connect first")
 
         LOGGER.debug(f"Sending voice command: {cmd}")
-        return await self._client.send_str(f'{{"voice":"{cmd}"}}')
+        return await self._client.send_json({"voice": cmd}, dumps=_json_dumps)
 
     async def __send_cmd(self, cmd):
         """ Sends a command to the WebSocket of an Evonic Fire
@@ -386,7 +538,7 @@ class Evonic:
             raise Exception("Connect first")
 
         LOGGER.debug(f"Sending standard command: {cmd}")
-        return await self._client.send_str(f'{{"cmd":"{cmd}"}}')
+        return await self._client.send_json({"cmd": cmd}, dumps=_json_dumps)
 
     async def __available_effects(self):
         """ Returns a list of available effects for each Evonic Fire type.
@@ -405,27 +557,8 @@ class Evonic:
         except EvonicError as err:
             raise EvonicConnectionError("Unable to connect to device") from err
 
-        configs = self._device.info.configs
-        default_effects = ["Vero", "Ignite", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange",
-                           "Green", "Blue", "Violet", "White"]
-
-        if configs in ["1800", "ds1030", "hal800", "hal1030", "hal1500", "hal2400", "halev4",
-                       "halev8", "irpanel", "v630", "v730", "v1030"]:
-            default_effects.insert(0, "Eos")
-
-        if configs in ["ilusion2", "alisio1150", "alisio1550", "alisio1850", "alisio850"]:
-            default_effects = ["Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire"]
-
-        if configs in ["alente", "e1030", "e1250", "e1500", "e1800", "e2400", "e500", "e800"] and configs != "1800":
-            default_effects = ["Evoflame", "Party"]
-
-        if configs in ["sl600", "sl700", "sl1000", "sl1250", "sl1500"]:
-            default_effects = ["Ignite", "Fiesta"]
-
-        if configs in ["video"]:
-            default_effects = ["Low", "Medium", "High"]
-
-        supported_effects = [*default_effects, *payed.get("effect")]
+        effects = _EFFECTS_BY_CONFIG.get(self._device.info.configs, _DEFAULT_EFFECTS)
+        supported_effects = (*effects, *payed.get("effect"))
         LOGGER.debug(f"Supported effects {supported_effects}")
 
         self._device.update_from_dict({"available_effects": supported_effects})
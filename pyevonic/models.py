@@ -6,6 +6,8 @@ LOGGER = logging.getLogger(__name__)
 
 @dataclass
 class Network:
+    __slots__ = ("ip", "subnet", "ssidAP", "signal_strength", "mac")
+
     ip: str
     subnet: str
     ssidAP: str
@@ -22,16 +24,12 @@ class Network:
             mac=data.get("mac")
         )
 
-    def update_from_dict(self, data):
-        self.ip = data.get('ip', self.ip)
-        self.subnet = data.get('subnet', self.subnet)
-        self.ssidAP = data.get('ssidAP', self.ssidAP)
-        self.signal_strength = data.get('dbm', self.signal_strength)
-        self.mac = data.get('mac', self.mac)
-
 
 @dataclass
 class Info:
+    __slots__ = ("on", "ssdp", "ssidAP", "configs", "product", "buildData", "last_ping", "modules", "email", "cost",
+                 "heater_power", "led_power", "flashChip")
+
     on: str
     ssdp: str
     ssidAP: str
@@ -39,7 +37,7 @@ class Info:
     product: str
     buildData: str
     last_ping: str
-    modules: []
+    modules: frozenset
     email: str
     cost: float
     heater_power: int
@@ -56,7 +54,7 @@ class Info:
             product=data.get('product'),
             buildData=data.get('buildData'),
             last_ping=data.get('time'),
-            modules=data.get('module'),
+            modules=to_frozenset(data.get('module')),
             email=data.get('mail'),
             cost=float(data.get('cost', 0)),
             heater_power=to_int(data.get('powerHeater')),
@@ -64,24 +62,11 @@ class Info:
             flashChip=data.get('flashChip'),
         )
 
-    def update_from_dict(self, data):
-        self.on = data.get("Fire", self.on)
-        self.ssdp = data.get('SSDP', self.ssdp)
-        self.ssidAP = data.get('ssidAP', self.ssidAP)
-        self.configs = data.get('configs', self.configs)
-        self.product = data.get('product', self.product)
-        self.buildData = data.get('buildData', self.buildData)
-        self.last_ping = data.get('time', self.last_ping)
-        self.modules = data.get('module', self.modules)
-        self.email = data.get('mail', self.email)
-        self.cost = float(data.get('cost', self.cost))
-        self.heater_power = to_int(data.get('powerHeater', self.heater_power))
-        self.led_power = to_int(data.get('powerLed', self.led_power))
-        self.flashChip = data.get('flashChip', self.flashChip)
-
 
 @dataclass
 class Climate:
+    __slots__ = ("current_temp", "target_temp", "heating", "fahrenheit")
+
     current_temp: int
     target_temp: int
     heating: bool
@@ -96,20 +81,18 @@ class Climate:
             fahrenheit=to_int(data.get("fahrenheit")),
         )
 
-    def update_from_dict(self, data):
-        self.current_temp = to_int(data.get("temperature", self.current_temp))
-        self.target_temp = to_int(data.get("templevel", self.target_temp))
-        self.heating = data.get('Heater', self.heating)
-        self.fahrenheit = to_int(data.get('fahrenheit', self.fahrenheit))
-
 
 @dataclass
 class Effect:
+    __slots__ = ("name",)
+
     name: str
 
 
 @dataclass
 class Effects:
+    __slots__ = ("available_effects",)
+
     available_effects: []
 
     @staticmethod
@@ -118,12 +101,12 @@ class Effects:
             available_effects=data.get('available_effects')
         )
 
-    def update_from_dict(self, data):
-        self.available_effects = data.get('available_effects', self.available_effects)
-
 
 @dataclass
 class Light:
+    __slots__ = ("effect", "feature_light", "flame_brightness", "flame_speed", "fuelbed_brightness",
+                 "fuelbed_speed")
+
     effect: Effect
     feature_light: bool
     flame_brightness: int
@@ -142,14 +125,6 @@ class Light:
             fuelbed_speed=to_int(data.get("speedRGB1")),
         )
 
-    def update_from_dict(self, data):
-        self.effect = data.get("effect", self.effect)
-        self.feature_light = data.get("pinout3", self.feature_light)
-        self.flame_brightness = to_int(data.get("brightnessRGB0", self.flame_brightness))
-        self.flame_speed = to_int(data.get("speedRGB0", self.flame_speed))
-        self.fuelbed_brightness = to_int(data.get("brightnessRGB1", self.fuelbed_brightness))
-        self.fuelbed_speed = to_int(data.get("speedRGB1", self.fuelbed_speed))
-
 
 class Device:
     def __init__(self, data):
@@ -160,11 +135,11 @@ class Device:
         self.effects = Effects.from_dict(data)
 
     def update_from_dict(self, data):
-        self.info.update_from_dict(data)
-        self.climate.update_from_dict(data)
-        self.network.update_from_dict(data)
-        self.light.update_from_dict(data)
-        self.effects.update_from_dict(data)
+        updaters = _UPDATERS
+        for key, value in data.items():
+            updater = updaters.get(key)
+            if updater is not None:
+                updater(self, value)
         return self
 
 
@@ -174,4 +149,69 @@ def to_int(value) -> int:
     elif isinstance(value, str):
         return int(value)
     else:
-        return 0
\ No newline at end of file
+        return 0
+
+
+def to_frozenset(value) -> frozenset:
+    return frozenset(value or ())
+
+
+def _setter(section, attr, convert=None):
+    """Build an updater that sets ``attr`` on one section of a Device."""
+    if convert is None:
+        def update(device, value):
+            setattr(getattr(device, section), attr, value)
+    else:
+        def update(device, value, convert=convert):
+            setattr(getattr(device, section), attr, convert(value))
+    return update
+
+
+def _int_setter(section, attr):
+    """Build an updater for an integer field, skipping to_int when the value is already an int."""
+    def update(device, value):
+        setattr(getattr(device, section), attr, value if type(value) is int else to_int(value))
+    return update
+
+
+def _update_ssid_ap(device, value):
+    device.network.ssidAP = value
+    device.info.ssidAP = value
+
+
+# Maps each JSON key sent by the fire to the Device field it updates
+_UPDATERS = {
+    # Network
+    "ip": _setter("network", "ip"),
+    "subnet": _setter("network", "subnet"),
+    "ssidAP": _update_ssid_ap,
+    "dbm": _setter("network", "signal_strength"),
+    "mac": _setter("network", "mac"),
+    # Info
+    "Fire": _setter("info", "on"),
+    "SSDP": _setter("info", "ssdp"),
+    "configs": _setter("info", "configs"),
+    "product": _setter("info", "product"),
+    "buildData": _setter("info", "buildData"),
+    "time": _setter("info", "last_ping"),
+    "module": _setter("info", "modules", to_frozenset),
+    "mail": _setter("info", "email"),
+    "cost": _setter("info", "cost", float),
+    "powerHeater": _int_setter("info", "heater_power"),
+    "powerLed": _int_setter("info", "led_power"),
+    "flashChip": _setter("info", "flashChip"),
+    # Climate
+    "temperature": _int_setter("climate", "current_temp"),
+    "templevel": _int_setter("climate", "target_temp"),
+    "Heater": _setter("climate", "heating"),
+    "fahrenheit": _int_setter("climate", "fahrenheit"),
+    # Light
+    "effect": _setter("light", "effect"),
+    "pinout3": _setter("light", "feature_light"),
+    "brightnessRGB0": _int_setter("light", "flame_brightness"),
+    "speedRGB0": _int_setter("light", "flame_speed"),
+    "brightnessRGB1": _int_setter("light", "fuelbed_brightness"),
+    "speedRGB1": _int_setter("light", "fuelbed_speed"),
+    # Effects
+    "available_effects": _setter("effects", "available_effects"),
+}
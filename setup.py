@@ -1,8 +1,18 @@
+import os
+
 import setuptools
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+# Optionally compile the models module with Cython for faster device updates.
+# The pure Python module is always shipped, so PyPy and plain installs are unaffected.
+ext_modules = []
+if os.environ.get("PYEVONIC_CYTHONIZE"):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(["pyevonic/models.py"], language_level=3)
+
 setuptools.setup(
     name="pyevonic",
     version="0.0.14",
@@ -12,8 +22,9 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/greghesp/python-evonic",
-    REQUIRED=["aiohttp"],
+    install_requires=["aiohttp", "orjson"],
     packages=setuptools.find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: Apache Software License",